@@ -1,2 +1,44 @@
-from betfairdatabase.api import clean, columns, export, index, insert, select
-from betfairdatabase.database import BetfairDatabase
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names are imported from the api module on first access, so that the
+# command line app does not pay for importing the whole package just to parse
+# its arguments
+__all__ = [
+    "BetfairDatabase",
+    "clean",
+    "columns",
+    "export",
+    "index",
+    "insert",
+    "iter_select",
+    "select",
+]
+# Submodules which used to be imported with the package and are therefore
+# accessible as its attributes, e.g. betfairdatabase.utils.ImportPatterns
+_SUBMODULES = ("api", "const", "database", "exceptions", "market", "racing", "utils")
+
+if TYPE_CHECKING:  # pragma: no cover
+    # Lets type checkers and IDEs see the lazily imported names
+    from betfairdatabase.api import (
+        clean,
+        columns,
+        export,
+        index,
+        insert,
+        iter_select,
+        select,
+    )
+    from betfairdatabase.database import BetfairDatabase
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in __all__:
+        return getattr(importlib.import_module(f"{__name__}.api"), name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Callable, Literal
+from typing import Callable, Iterator, Literal
 
 from betfairdatabase.const import DuplicatePolicy
 from betfairdatabase.database import BetfairDatabase
@@ -41,6 +41,34 @@ def select(
     return BetfairDatabase(database_dir).select(columns, where, limit, return_dict)
 
 
+def iter_select(
+    database_dir: str | Path,
+    columns: list[str] = None,
+    where: str = None,
+    limit: int = None,
+    return_dict: bool = True,
+) -> Iterator[dict | tuple]:
+    """
+    Selects data from the index and yields it one entry at a time.
+
+    Parameters:
+        - database_dir: Main directory of the database initialised with 'index'.
+        - columns: Names of columns to return. If not specified, returns all columns.
+        - where: SQL "WHERE" query for selecting data from the database.
+        - limit: Maximum number of entries to return. Returns all entries if not specified.
+        - return_dict: If True, returns each entry as {column name: value} mapping. If False,
+                        returns just the values (faster, but harder to work with).
+
+    Returns:
+        An iterator of dicts if return_dict=True, else an iterator of tuples.
+
+    Unlike 'select', entries are not all loaded into memory at once, which makes
+    this method suitable for processing large amounts of data. The index remains
+    open until the iterator is exhausted or closed.
+    """
+    return BetfairDatabase(database_dir).iter_select(columns, where, limit, return_dict)
+
+
 def columns() -> list:
     """Returns a list of queryable database columns."""
     return BetfairDatabase.columns()
@@ -48,14 +76,15 @@ def columns() -> list:
 
 def export(database_dir: str | Path, dest: str | Path = ".") -> Path:
     """
-    Exports the database to a CSV file and returns the path to it.
+    Exports the database to a CSV or a Parquet file and returns the path to it.
 
     dest can be either a directory or a file name. If it is a directory,
-    the output file name becomes database name + ".csv"
+    the output file name becomes database name + ".csv". If it is a file
+    name ending with ".parquet", the database is exported in Parquet format,
+    which requires pyarrow to be installed.
 
-    WARNING!
-    This can be very slow and resource-intensive for large databases.
-    No optimisations, such as chunkifying read data, are performed.
+    Rows are streamed from the index to the file in chunks, so the memory
+    footprint does not grow with the size of the database.
     """
     return BetfairDatabase(database_dir).export(dest)
 
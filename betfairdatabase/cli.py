@@ -1,12 +1,10 @@
 from argparse import ArgumentParser
 
-from betfairdatabase import api
 from betfairdatabase.exceptions import (
     DatabaseDirectoryError,
     IndexExistsError,
     IndexMissingError,
 )
-from betfairdatabase.utils import ImportPatterns
 
 IMPORT_PATTERNS = ("betfair_historical", "event_id", "flat")
 ON_DUPLICATES = ("skip", "replace", "update")
@@ -122,6 +120,9 @@ def main():
     """Entry point for the command line app."""
     parser = get_parser()
     args = parser.parse_args()
+    # Imported only once arguments are valid, so that --help and --version are quick
+    from betfairdatabase import api
+
     try:
         match args.command:
             case "index":
@@ -135,6 +136,8 @@ def main():
             case "export":
                 api.export(args.database_dir, args.dest)
             case "insert":
+                from betfairdatabase.utils import ImportPatterns
+
                 # Parser should catch invalid options for "pattern"
                 pattern = getattr(ImportPatterns, args.pattern)
                 api.insert(
@@ -3,6 +3,9 @@ from enum import Enum
 INDEX_FILENAME = ".betfairdatabaseindex"
 DATA_FILE_SUFFIXES = ("", ".zip", ".gz", ".bz2")
 SQL_TABLE_NAME = "BetfairDatabaseIndex"
+EXPORT_CHUNK_SIZE = 10_000  # Number of rows fetched at a time when exporting
+EXPORT_BUFFER_SIZE = 1024 * 1024  # Size of the CSV export file buffer in bytes
+SQL_INSERT_BATCH_SIZE = 5_000  # Number of rows inserted at a time when indexing
 ROWID = "rowid"
 MARKET_DATA_FILE_PATH = "marketDataFilePath"
 MARKET_CATALOGUE_FILE_PATH = "marketCatalogueFilePath"
@@ -44,6 +47,31 @@ SQL_TABLE_COLUMNS = (
     MARKET_DATA_FILE_PATH,
 )
 
+# Columns which are commonly queried and therefore indexed to speed up lookups
+SQL_INDEXED_COLUMNS = ("marketId", "marketStartTime", "eventTypeId", "eventId")
+
+# Applied to every connection to the index. None of these modify the index file,
+# so they are safe to apply to read-only connections as well.
+SQLITE_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-32768",  # 32 MiB
+    "mmap_size=536870912",  # 512 MiB
+)
+# Index file itself, followed by its rollback journal, and write-ahead log and
+# shared memory files left behind by indexes created in WAL journal mode
+SQLITE_JOURNAL_SUFFIXES = ("", "-journal", "-wal", "-shm")
+# Arrow data types of columns which do not hold strings, used for Parquet export
+PARQUET_COLUMN_TYPES = {
+    "persistenceEnabled": "int64",
+    "bspMarket": "int64",
+    "turnInPlayEnabled": "int64",
+    "eachWayDivisor": "float64",
+    "runners": "int64",
+    "raceDistanceMeters": "float64",
+    "raceDistanceFurlongs": "float64",
+}
+
 
 class DuplicatePolicy(Enum):
     """
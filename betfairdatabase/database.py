@@ -1,19 +1,31 @@
 import contextlib
-import csv
+import itertools
 import logging
 import os
 import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from json import JSONDecodeError
-from pathlib import Path
-from typing import Callable, Literal
+from pathlib import Path, PurePath
+from typing import Callable, Iterable, Iterator, Literal
+from urllib.parse import quote
 
 from betfairdatabase.const import (
+    DATA_FILE_SUFFIXES,
+    EXPORT_BUFFER_SIZE,
+    EXPORT_CHUNK_SIZE,
     INDEX_FILENAME,
     MARKET_CATALOGUE_FILE_PATH,
     MARKET_DATA_FILE_PATH,
+    PARQUET_COLUMN_TYPES,
     ROWID,
+    SQL_INDEXED_COLUMNS,
+    SQL_INSERT_BATCH_SIZE,
     SQL_TABLE_COLUMNS,
     SQL_TABLE_NAME,
+    SQLITE_JOURNAL_SUFFIXES,
+    SQLITE_PRAGMAS,
     DuplicatePolicy,
     SQLAction,
 )
@@ -23,12 +35,29 @@ from betfairdatabase.exceptions import (
     IndexMissingError,
     MarketDataFileError,
 )
-from betfairdatabase.market import Market
+from betfairdatabase.market import NO_MARKET_DATA_FILE, Market
 from betfairdatabase.racing import RacingDataProcessor
 from betfairdatabase.utils import ImportPatterns
 
 logger = logging.getLogger(__name__)
 
+# SQL statements which only depend on the table definition are built once
+CREATE_TABLE_SQL = (
+    f"CREATE TABLE {SQL_TABLE_NAME}({','.join(SQL_TABLE_COLUMNS)}"
+    f", UNIQUE({MARKET_CATALOGUE_FILE_PATH},{MARKET_DATA_FILE_PATH}))"
+)
+INSERT_SQL = (
+    f"INSERT INTO {SQL_TABLE_NAME} VALUES ({','.join('?' * len(SQL_TABLE_COLUMNS))})"
+)
+CREATE_INDEXES_SQL = tuple(
+    f"CREATE INDEX {column}Index ON {SQL_TABLE_NAME}({column})"
+    for column in SQL_INDEXED_COLUMNS
+)
+DELETE_SQL = f"DELETE FROM {SQL_TABLE_NAME} WHERE {MARKET_CATALOGUE_FILE_PATH} = ?"
+DELETE_ROW_SQL = f"DELETE FROM {SQL_TABLE_NAME} WHERE {ROWID} = ?"
+SELECT_ALL_SQL = f"SELECT * FROM {SQL_TABLE_NAME}"
+SELECT_DATA_FILES_SQL = f"SELECT {ROWID}, {MARKET_DATA_FILE_PATH} FROM {SQL_TABLE_NAME}"
+
 
 class BetfairDatabase:
     """
@@ -59,19 +88,26 @@ class BetfairDatabase:
         # Check if index already exists and whether it should be overwritten
         if self._index_file.exists():
             if force:
-                self._index_file.unlink()
+                # Stale journal files must not be applied to the new index
+                for suffix in SQLITE_JOURNAL_SUFFIXES:
+                    Path(f"{self._index_file}{suffix}").unlink(missing_ok=True)
             else:
                 raise IndexExistsError(
                     self.database_dir,
                     " Use force=True option to reindex the database.",
                 )
         # Construct index
-        with contextlib.closing(sqlite3.connect(self._index_file)) as conn, conn:
-            conn.execute(
-                f"CREATE TABLE {SQL_TABLE_NAME}({','.join(SQL_TABLE_COLUMNS)}"
-                f", UNIQUE({','.join(SQL_TABLE_COLUMNS[-2:])}))"
-            )
-            return self._handle_market_catalogues(self.database_dir, conn)
+        with contextlib.closing(self._connect()) as conn, conn:
+            # A half-written index is useless anyway and gets rebuilt with force=True,
+            # so there is no point in waiting for the data to reach the disk
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(CREATE_TABLE_SQL)
+            rows_inserted = self._handle_market_catalogues(self.database_dir, conn)
+            # Indexing the table once it is filled is faster than updating the
+            # index with every insert
+            for create_index_sql in CREATE_INDEXES_SQL:
+                conn.execute(create_index_sql)
+            return rows_inserted
 
     def insert(
         self,
@@ -101,7 +137,7 @@ class BetfairDatabase:
         duplicate_policy = DuplicatePolicy(on_duplicates)
         if not self._index_file.exists():
             self.index()  # Make a database if it does not exist
-        with contextlib.closing(sqlite3.connect(self._index_file)) as conn, conn:
+        with contextlib.closing(self._connect()) as conn, conn:
             return self._handle_market_catalogues(
                 source_dir,
                 conn,
@@ -131,24 +167,45 @@ class BetfairDatabase:
         Returns:
             A list of dicts if return_dict=True, else a list of tuples.
         """
+        return list(self.iter_select(columns, where, limit, return_dict))
+
+    def iter_select(
+        self,
+        columns: list[str] = None,
+        where: str = None,
+        limit: int = None,
+        return_dict: bool = True,
+    ) -> Iterator[dict | tuple]:
+        """
+        Selects data from the index and yields it one entry at a time.
+
+        Parameters:
+            - database_dir: Main directory of the database initialised with 'index'.
+            - columns: Names of columns to return. If not specified, returns all columns.
+            - where: SQL "WHERE" query for selecting data from the database.
+            - limit: Maximum number of entries to return. Returns all entries if not specified.
+            - return_dict: If True, returns each entry as {column name: value} mapping. If False,
+                            returns just the values (faster, but harder to work with).
+
+        Returns:
+            An iterator of dicts if return_dict=True, else an iterator of tuples.
+
+        Unlike 'select', entries are not all loaded into memory at once, which makes
+        this method suitable for processing large amounts of data. The index remains
+        open until the iterator is exhausted or closed.
+        """
         # Cannot select data if it hasn't been indexed
         if not self._index_file.exists():
             raise IndexMissingError(self.database_dir)
 
-        # Expand SQL queries
-        query_columns = "*" if columns is None else ",".join(columns)
-        query_where = "" if where is None else f"WHERE {where}"
-        query_limit = "" if limit is None else f"LIMIT {limit}"
-
-        with contextlib.closing(sqlite3.connect(self._index_file)) as conn, conn:
-            values = conn.execute(
-                f"SELECT {query_columns} FROM {SQL_TABLE_NAME} {query_where} {query_limit}"
-            ).fetchall()
-
-        if return_dict:
-            return [dict(zip(columns or SQL_TABLE_COLUMNS, v)) for v in values]
-        else:
-            return values
+        sql = self._build_select_sql(
+            None if columns is None else tuple(columns), where, limit is not None
+        )
+        return self._iter_rows(
+            sql,
+            () if limit is None else (limit,),
+            (columns or SQL_TABLE_COLUMNS) if return_dict else None,
+        )
 
     # Must be a callable as static property is not a thing
     @staticmethod
@@ -158,24 +215,34 @@ class BetfairDatabase:
 
     def export(self, dest: str | Path = ".") -> Path:
         """
-        Exports the database to a CSV file and returns the path to it.
+        Exports the database to a CSV or a Parquet file and returns the path to it.
 
         dest can be either a directory or a file name. If it is a directory,
-        the output file name becomes database name + ".csv"
+        the output file name becomes database name + ".csv". If it is a file
+        name ending with ".parquet", the database is exported in Parquet format,
+        which requires pyarrow to be installed.
 
-        WARNING!
-        This can be very slow and resource-intensive for large databases.
-        No optimisations, such as chunkifying read data, are performed.
+        Rows are streamed from the index to the file in chunks, so the memory
+        footprint does not grow with the size of the database.
         """
+        # Cannot export data if it hasn't been indexed
+        if not self._index_file.exists():
+            raise IndexMissingError(self.database_dir)
         dest = Path(dest)
         if dest.is_dir():
             dest /= self.database_dir.name + ".csv"
-        data = self.select()
-        if data:
-            with open(dest, "w", newline="") as f:
-                writer = csv.DictWriter(f, data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
+        with contextlib.closing(self._connect(read_only=True)) as conn, conn:
+            cursor = conn.execute(SELECT_ALL_SQL)
+            # Do not create a file if there is nothing to export
+            if rows := cursor.fetchmany(EXPORT_CHUNK_SIZE):
+                column_names = [column[0] for column in cursor.description]
+                chunks = itertools.chain(
+                    [rows], iter(lambda: cursor.fetchmany(EXPORT_CHUNK_SIZE), [])
+                )
+                if dest.suffix == ".parquet":
+                    self._write_parquet(dest, column_names, chunks)
+                else:
+                    self._write_csv(dest, column_names, chunks)
         return dest
 
     def clean(self):
@@ -189,34 +256,187 @@ class BetfairDatabase:
         # Cannot process data if it has not been indexed
         if not self._index_file.exists():
             raise IndexMissingError(self.database_dir)
-        with contextlib.closing(sqlite3.connect(self._index_file)) as conn, conn:
-            # Iterate over table rows, test if market data file exists, mark files which don't
-            cursor = conn.cursor()
-            for row in conn.execute(
-                f"SELECT {ROWID}, {MARKET_DATA_FILE_PATH} FROM {SQL_TABLE_NAME}"
-            ):
-                row_id, data_file_path = row
-                if not os.path.exists(
-                    data_file_path
-                ):  # Faster than creating a Path object just to test this
-                    cursor.execute(
-                        f"UPDATE {SQL_TABLE_NAME}"
-                        f" SET {MARKET_DATA_FILE_PATH} = NULL WHERE {ROWID} = {row_id}"
-                    )
-            # Delete all marked rows
-            conn.execute(
-                f"DELETE FROM {SQL_TABLE_NAME} WHERE {MARKET_DATA_FILE_PATH} IS NULL"
-            )
+        with contextlib.closing(self._connect()) as conn, conn:
+            # Group market data files by directory, so that the contents of each
+            # directory are listed only once instead of testing every file separately
+            rows_by_dir = defaultdict(list)
+            for row_id, data_file_path in conn.execute(SELECT_DATA_FILES_SQL):
+                data_dir, data_file_name = os.path.split(data_file_path)
+                rows_by_dir[data_dir].append((row_id, data_file_name))
+            missing_row_ids = []
+            for data_dir, rows in rows_by_dir.items():
+                try:
+                    file_names = set(os.listdir(data_dir))
+                except OSError:  # Directory is gone or inaccessible
+                    file_names = set()
+                missing_row_ids.extend(
+                    (row_id,) for row_id, name in rows if name not in file_names
+                )
+            conn.executemany(DELETE_ROW_SQL, missing_row_ids)
 
     ################# PRIVATE METHODS #######################
 
     @staticmethod
-    def _locate_market_catalogues(target_dir: str | Path) -> list[Path]:
+    @lru_cache(maxsize=128)
+    def _build_select_sql(
+        columns: tuple[str, ...] | None, where: str | None, has_limit: bool
+    ) -> str:
         """
-        Returns a list of path to market catalogues found in the
-        target directory.
+        Expands select() arguments into an SQL query. The limit is bound as a parameter,
+        so repeated queries differing only by the limit share the same SQL text.
+        """
+        query_columns = "*" if columns is None else ",".join(columns)
+        query_where = "" if where is None else f"WHERE {where}"
+        query_limit = "LIMIT ?" if has_limit else ""
+        return (
+            f"SELECT {query_columns} FROM {SQL_TABLE_NAME} {query_where} {query_limit}"
+        )
+
+    def _iter_rows(
+        self, sql: str, parameters: tuple, column_names: list[str] | None
+    ) -> Iterator[dict | tuple]:
+        """
+        Executes an SQL query and yields the resulting rows one by one. Rows are
+        yielded as dicts if column names are provided, else as tuples.
+        """
+        with contextlib.closing(self._connect(read_only=True)) as conn, conn:
+            cursor = conn.execute(sql, parameters)
+            if column_names is None:
+                yield from cursor
+            else:
+                for row in cursor:
+                    yield dict(zip(column_names, row))
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Opens a connection to the index and tunes it for performance.
+
+        Read-only connections never write to the index, so they also work
+        with indexes which the user does not have permission to modify.
+        """
+        if read_only:
+            connection = sqlite3.connect(
+                self._build_read_only_uri(Path(os.path.abspath(self._index_file))),
+                uri=True,
+            )
+        else:
+            connection = sqlite3.connect(self._index_file)
+        for pragma in SQLITE_PRAGMAS:
+            connection.execute(f"PRAGMA {pragma}")
+        return connection
+
+    @staticmethod
+    def _build_read_only_uri(index_file: PurePath) -> str:
         """
-        return Path(target_dir).rglob("1.*.json")
+        Builds an SQLite URI which opens the index file in read-only mode.
+
+        The URI authority is left empty, because SQLite rejects any other than
+        "localhost". Windows UNC paths, such as those of network shares, thus
+        become "file:////server/share/..." instead of "file://server/share/...".
+        """
+        path = index_file.as_posix()
+        if not path.startswith("/"):
+            path = "/" + path  # Windows path starting with a drive letter
+        return f"file://{quote(path, safe='/:')}?mode=ro"
+
+    @staticmethod
+    def _write_csv(
+        dest: Path, column_names: list[str], chunks: Iterable[list[tuple]]
+    ) -> None:
+        """Writes chunks of table rows to a CSV file."""
+        import csv
+
+        with open(dest, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(column_names)
+            for rows in chunks:
+                writer.writerows(rows)
+
+    @staticmethod
+    def _write_parquet(
+        dest: Path, column_names: list[str], chunks: Iterable[list[tuple]]
+    ) -> None:
+        """Writes chunks of table rows to a Parquet file."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as ex:
+            raise ImportError(
+                "Exporting to Parquet requires pyarrow. Install it by running"
+                " 'pip install pyarrow'."
+            ) from ex
+
+        schema = pa.schema(
+            (name, pa.type_for_alias(PARQUET_COLUMN_TYPES.get(name, "string")))
+            for name in column_names
+        )
+        with pq.ParquetWriter(dest, schema, compression="zstd") as writer:
+            for rows in chunks:
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [
+                            pa.array(values, type=field.type)
+                            for values, field in zip(zip(*rows), schema)
+                        ],
+                        schema=schema,
+                    )
+                )
+
+    @staticmethod
+    def _locate_market_files(
+        target_dir: str | Path,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Yields pairs of paths to market catalogues found in the target directory
+        and its subdirectories, and to their market data files. Market data file
+        path is NO_MARKET_DATA_FILE if it was not found next to the market catalogue.
+
+        Walks the directory tree with os.scandir, which is considerably faster than
+        Path.rglob as it neither creates Path objects nor matches glob patterns.
+        Market data files are looked up among the names listed in the same pass,
+        instead of testing each candidate file name for existence.
+        Symbolic links to directories are not followed and unreadable directories
+        are skipped.
+        """
+        dirs_to_scan = [str(Path(target_dir).resolve())]
+        while dirs_to_scan:
+            current_dir = dirs_to_scan.pop()
+            file_names = set()
+            market_catalogue_names = []
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs_to_scan.append(entry.path)
+                            continue
+                        file_names.add(entry.name)
+                        if entry.name.startswith("1.") and entry.name.endswith(".json"):
+                            market_catalogue_names.append(entry.name)
+            except OSError:
+                pass  # Directory is gone or inaccessible
+            for name in market_catalogue_names:
+                base_name = name.removesuffix(".json")
+                yield os.path.join(current_dir, name), next(
+                    (
+                        os.path.join(current_dir, base_name + suffix)
+                        for suffix in DATA_FILE_SUFFIXES
+                        if base_name + suffix in file_names
+                    ),
+                    NO_MARKET_DATA_FILE,
+                )
+
+    @staticmethod
+    def _load_market(market_files: tuple[str, str]) -> Market:
+        """
+        Creates a Market object from the pair of market catalogue and market data
+        file paths and parses its market catalogue in advance.
+
+        Parsing errors are ignored here and handled when the market is processed.
+        """
+        market = Market(*market_files)
+        with contextlib.suppress(JSONDecodeError):
+            market.market_catalogue_data
+        return market
 
     def _handle_market_catalogues(
         self,
@@ -237,50 +457,99 @@ class BetfairDatabase:
         into the database, but should be omitted when indexing the database.
         """
         rows_inserted = 0
-        corrupt_markets = []
-        markets = list(Market(mc) for mc in self._locate_market_catalogues(source_dir))
-        # Two-pass required, so cache generated Market objects in RAM
-        for market in markets:
-            try:
-                self._racing_data_processor.add(market)  # Rejects non-racing markets
-            except JSONDecodeError:
-                logger.error(f"Error parsing '{market.market_catalogue_file}'.")
-                corrupt_markets.append(market)
-        for market in corrupt_markets:
-            markets.remove(market)
+        pending_rows = []
+        # Reading and parsing market catalogues is the slowest part of processing
+        # and it is mostly I/O-bound, so it is spread across multiple threads
+        with ThreadPoolExecutor() as executor:
+            loaded_markets = executor.map(
+                self._load_market, self._locate_market_files(source_dir)
+            )
+            # Two-pass required, so cache generated Market objects in RAM.
+            # Corrupt markets are left out in the same pass.
+            markets = []
+            for market in loaded_markets:
+                try:
+                    # Rejects non-racing markets
+                    self._racing_data_processor.add(market)
+                except JSONDecodeError:
+                    logger.error(f"Error parsing '{market.market_catalogue_file}'.")
+                else:
+                    markets.append(market)
+        # Database is being updated
+        if import_pattern and on_duplicates:
+            markets = self._relocate_markets(
+                markets, copy, import_pattern, on_duplicates
+            )
         for market in markets:
+            if market.sql_action is SQLAction.SKIP:
+                continue
             try:
-                # Database is being updated
-                if import_pattern and on_duplicates:
-                    dest_dir = self.database_dir / import_pattern(
-                        market.market_catalogue_data
-                    )
-                    market = (
-                        market.copy(dest_dir, on_duplicates)
-                        if copy
-                        else market.move(dest_dir, on_duplicates)
-                    )
-                    if market.sql_action is SQLAction.SKIP:
-                        continue
-
-                sql_data_map = market.create_sql_mapping(
+                row = market.create_sql_row(
                     # Rejects non-racing markets
                     self._racing_data_processor.get(market)
                 )
                 if market.sql_action is SQLAction.UPDATE:
                     # SQL does not support updating a whole row at a time and requires one to list
                     # individual fields and values to update. A simpler way to achieve the same
-                    # outcome is to delete and re-insert the row.
-                    connection.execute(
-                        f"DELETE FROM {SQL_TABLE_NAME}"
-                        f" WHERE {MARKET_CATALOGUE_FILE_PATH} = '{market.market_catalogue_file}'"
-                    )
-                connection.execute(
-                    f"INSERT INTO {SQL_TABLE_NAME} VALUES ({','.join('?'*len(sql_data_map))})",
-                    tuple(sql_data_map.values()),
-                )
+                    # outcome is to delete and re-insert the row. Pending rows are flushed
+                    # first because the row to delete may still be among them.
+                    self._insert_rows(connection, pending_rows)
+                    connection.execute(DELETE_SQL, (str(market.market_catalogue_file),))
+                pending_rows.append(row)
+                if len(pending_rows) >= SQL_INSERT_BATCH_SIZE:
+                    self._insert_rows(connection, pending_rows)
                 rows_inserted += 1
             except MarketDataFileError:
                 # Log warning that a data file is missing
                 pass
+        self._insert_rows(connection, pending_rows)
         return rows_inserted
+
+    def _relocate_markets(
+        self,
+        markets: list[Market],
+        copy: bool,
+        import_pattern: Callable[[dict], str],
+        on_duplicates: DuplicatePolicy,
+    ) -> list[Market]:
+        """
+        Copies or moves market files into the database and returns the relocated
+        markets in their original order. Markets with a missing market data file
+        are left out.
+
+        Files are transferred in multiple threads. Markets sharing the same destination
+        are processed in order within a single thread, so that duplicates are resolved
+        in the same way as if all the markets were processed one after the other.
+        """
+        relocated_markets = [None] * len(markets)
+        markets_by_dest = defaultdict(list)
+        # Resolved once, so that paths are consistent with those stored by index()
+        database_dir = self.database_dir.resolve()
+        for position, market in enumerate(markets):
+            dest_dir = database_dir / import_pattern(market.market_catalogue_data)
+            markets_by_dest[dest_dir / market.market_catalogue_file.name].append(
+                (position, market, dest_dir)
+            )
+
+        def relocate(markets_with_same_dest: list[tuple[int, Market, Path]]) -> None:
+            for position, market, dest_dir in markets_with_same_dest:
+                try:
+                    relocated_markets[position] = (
+                        market.copy(dest_dir, on_duplicates)
+                        if copy
+                        else market.move(dest_dir, on_duplicates)
+                    )
+                except MarketDataFileError:
+                    pass
+
+        with ThreadPoolExecutor() as executor:
+            # Consume the results to propagate any exceptions raised in the threads
+            list(executor.map(relocate, markets_by_dest.values()))
+        return [market for market in relocated_markets if market is not None]
+
+    @staticmethod
+    def _insert_rows(connection: sqlite3.Connection, rows: list[tuple]) -> None:
+        """Inserts rows into the SQL table in a single batch and empties the list."""
+        if rows:
+            connection.executemany(INSERT_SQL, rows)
+            rows.clear()
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import copy as cp
-import json
-import shutil
-from functools import cache, cached_property
+import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -17,11 +16,36 @@ from betfairdatabase.const import (
 from betfairdatabase.exceptions import MarketDataFileError
 from betfairdatabase.utils import parse_datetime
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
 RACING_EVENT_TYPE_IDS = (
     "7",  # Horse racing
     "4339",  # Greyhound racing
 )
 
+# SQL table columns holding values nested one level deep in market catalogue data,
+# mapped to the names of the parent field and the nested field
+NESTED_COLUMNS = {
+    "priceLadderDescriptionType": ("priceLadderDescription", "type"),
+    "lineRangeInfoMarketUnit": ("lineRangeInfo", "marketUnit"),
+    "eventTypeId": ("eventType", "id"),
+    "eventTypeName": ("eventType", "name"),
+    "competitionId": ("competition", "id"),
+    "competitionName": ("competition", "name"),
+    "eventId": ("event", "id"),
+    "eventName": ("event", "name"),
+    "eventCountryCode": ("event", "countryCode"),
+    "eventTimezone": ("event", "timezone"),
+    "eventVenue": ("event", "venue"),
+    "eventOpenDate": ("event", "openDate"),
+}
+# Passed as market_data_file when the caller already knows that there is no
+# market data file next to the market catalogue
+NO_MARKET_DATA_FILE = ""
+
 
 class Market:
     """
@@ -30,8 +54,19 @@ class Market:
     Improves performance by caching results of slow I/O or CPU-intensive operations.
     """
 
-    def __init__(self, market_catalogue_file: str | Path):
-        self.market_catalogue_file = Path(market_catalogue_file).resolve()
+    def __init__(
+        self,
+        market_catalogue_file: str | Path,
+        market_data_file: str | Path | None = None,
+    ):
+        # Absolute paths are much cheaper to compute than resolved ones,
+        # because they do not require a system call for every path component
+        self.market_catalogue_file = Path(os.path.abspath(market_catalogue_file))
+        # Already located by the caller, so it does not need to be searched for
+        if market_data_file == NO_MARKET_DATA_FILE:
+            self._market_data_file = None
+        elif market_data_file is not None:
+            self._market_data_file = Path(os.path.abspath(market_data_file))
         self.sql_action = SQLAction.INSERT
 
     @property
@@ -44,16 +79,19 @@ class Market:
         and share the same basename.
         """
         try:
-            return self._market_data_file
+            market_data_file = self._market_data_file
         except AttributeError:
             for suffix in DATA_FILE_SUFFIXES:
                 data_file = self.market_catalogue_file.with_suffix(suffix)
-                if data_file.exists():
-                    self._market_data_file = data_file.resolve()
+                if data_file.is_file():
+                    self._market_data_file = data_file
                     return self._market_data_file
+            market_data_file = None
+        if market_data_file is None:
             raise MarketDataFileError(
                 f"Market data file is missing for market catalogue '{self.market_catalogue_file}'."
             )
+        return market_data_file
 
     @cached_property
     def market_catalogue_data(self) -> dict:
@@ -83,7 +121,19 @@ class Market:
         If no_paths is True, marketCatalogueFilePath and marketDataFilePath
         field values are set to None.
         """
-        # Call below is cached, so it must be a separate method
+        return dict(
+            zip(SQL_TABLE_COLUMNS, self.create_sql_row(additional_metadata, no_paths))
+        )
+
+    def create_sql_row(
+        self, additional_metadata: dict | None = None, no_paths: bool = False
+    ) -> tuple:
+        """
+        Returns a tuple of values in a row, ordered as SQL table columns.
+
+        If no_paths is True, marketCatalogueFilePath and marketDataFilePath
+        field values are set to None.
+        """
         data = self._transform_market_catalogue()
 
         # Insert additional metadata if any is provided
@@ -98,7 +148,7 @@ class Market:
             data["marketDataFilePath"] = self._str_or_none(self.market_data_file)
 
         # All keys not in SQL_TABLE_COLUMNS are dropped
-        return {k: data.get(k, None) for k in SQL_TABLE_COLUMNS}
+        return tuple(map(data.get, SQL_TABLE_COLUMNS))
 
     def copy(self, dest_dir: str | Path, on_duplicates: DuplicatePolicy) -> Market:
         """
@@ -124,47 +174,45 @@ class Market:
 
     @staticmethod
     def _parse_json_file(file: Path) -> dict:
-        """Parses a JSON file and returns it as a dict."""
-        with open(file, encoding="utf-8") as f:
-            return json.load(f)
+        """Parses a UTF-8 encoded JSON file and returns it as a dict."""
+        with open(file, "rb") as f:
+            return json_loads(f.read())
 
     @staticmethod
-    def _flatten_subdict(parent_dict: dict[str, Any], child_key: str) -> None:
+    def _move_file(src: Path, dst: Path) -> None:
         """
-        Flattens a dictionary by combining parent and child's key names.
-        Modifies the dictionary in place.
+        Moves a file, replacing the destination file if it exists.
+
+        Renames the file if possible, which is much cheaper than shutil.move,
+        and falls back to shutil.move when moving across file systems.
         """
-        if subdict := parent_dict.pop(child_key, None):
-            for subkey, value in subdict.items():
-                # Preserve camel case in the combined key
-                combined_key = child_key + subkey[0].upper() + subkey[1:]
-                parent_dict[combined_key] = value
+        try:
+            os.replace(src, dst)
+        except OSError:
+            import shutil
+
+            shutil.move(src, dst)
 
     @staticmethod
     def _str_or_none(obj) -> str | None:
         """Returns None if the obj is None, else its string representation."""
         return None if obj is None else str(obj)
 
-    @cache
     def _transform_market_catalogue(self) -> dict:
         """
         Transforms parsed market catalogue data into a flat dict
         representation suitable for SQL table import.
         """
-        # Break out unnecessary parts and those that need further processing
-        data = self.market_catalogue_data.copy()
-
-        if description := data.pop("description", None):
-            self._flatten_subdict(description, "priceLadderDescription")
-            self._flatten_subdict(description, "lineRangeInfo")
-            data.update(description)
-
-        if runners := data.pop("runners", None):
-            data["runners"] = len(runners)  # Only note down the number of selections
-
-        self._flatten_subdict(data, "eventType")
-        self._flatten_subdict(data, "competition")
-        self._flatten_subdict(data, "event")
+        # Market description fields are stored alongside top-level fields
+        fields = self.market_catalogue_data | (
+            self.market_catalogue_data.get("description") or {}
+        )
+        data = dict(zip(SQL_TABLE_COLUMNS, map(fields.get, SQL_TABLE_COLUMNS)))
+        for column, (parent_field, nested_field) in NESTED_COLUMNS.items():
+            if (parent := fields.get(parent_field)) and nested_field in parent:
+                data[column] = parent[nested_field]
+        # Only note down the number of selections
+        data["runners"] = len(runners) if (runners := fields.get("runners")) else None
 
         # Calculate local times if possible
         try:
@@ -191,7 +239,7 @@ class Market:
         market data files have been updated as if the .
         """
         # Determine output dir and destination file paths
-        dest_dir = Path(dest_dir).resolve()
+        dest_dir = Path(os.path.abspath(dest_dir))
 
         # Process market catalogue?
         market_catalogue_dest_file = dest_dir / self.market_catalogue_file.name
@@ -225,12 +273,14 @@ class Market:
                 process_market_data_file = False
 
         # Copy or move the files to the destination if required.
-        # Both shutil.copy and shutil.move replace the destination file if it exists.
+        # Both file operations replace the destination file if it exists.
         if copy:
-            file_operation = shutil.copy
+            import shutil
+
+            file_operation = shutil.copyfile  # Permission bits are not needed
             market = cp.copy(self)  # Create a copy of itself to modify
         else:
-            file_operation = shutil.move
+            file_operation = self._move_file
             market = self  # Modify itself in-place
 
         dest_dir.mkdir(exist_ok=True, parents=True)
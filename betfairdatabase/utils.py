@@ -1,22 +1,38 @@
 import datetime as dt
-from zoneinfo import ZoneInfo
+from functools import lru_cache
 
+# Same as strftime's "%b" in the C locale, but independent of the current locale
+MONTH_ABBREVIATIONS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
 
+
+@lru_cache(maxsize=8192)
 def parse_datetime(datetime_str: str) -> dt.datetime:
     """
     Parses Betfair's ISO 8601 datetime format.
 
-    Returns a timezone-aware datetime object.
+    Returns a timezone-aware datetime object. Results are cached because
+    many markets share the same start time or event open date.
     """
-    try:
-        # Python >= 3.11 parses timezone
-        return dt.datetime.fromisoformat(datetime_str)
-    except ValueError:
-        # Python 3.10 does not, so remove "Zulu" time marker from the end annd
-        # manually add the timezone
-        return dt.datetime.fromisoformat(datetime_str.replace("Z", "")).replace(
-            tzinfo=ZoneInfo("UTC")
+    if datetime_str.endswith("Z"):
+        # Python 3.10 cannot parse the "Zulu" time marker, so remove it from
+        # the end and add the timezone manually
+        return dt.datetime.fromisoformat(datetime_str[:-1]).replace(
+            tzinfo=dt.timezone.utc
         )
+    return dt.datetime.fromisoformat(datetime_str)
 
 
 class ImportPatterns:
@@ -43,7 +59,8 @@ class ImportPatterns:
         """
         market_time = parse_datetime(market_catalogue_data["marketStartTime"])
         event_id = market_catalogue_data["event"]["id"]
-        return market_time.strftime(f"%Y/%b/{market_time.day}/{event_id}")
+        month = MONTH_ABBREVIATIONS[market_time.month - 1]
+        return f"{market_time.year}/{month}/{market_time.day}/{event_id}"
 
     @staticmethod
     def event_id(market_catalogue_data: dict) -> str:
@@ -1,11 +1,23 @@
 import inspect
+import subprocess
+import sys
 import unittest
 from collections import OrderedDict
 from unittest import mock
 
+import betfairdatabase
 import betfairdatabase.api as api
+import betfairdatabase.utils as utils
 
-API_METHOD_NAMES = ("clean", "columns", "export", "index", "insert", "select")
+API_METHOD_NAMES = (
+    "clean",
+    "columns",
+    "export",
+    "index",
+    "insert",
+    "iter_select",
+    "select",
+)
 
 
 class TestAPI(unittest.TestCase):
@@ -59,7 +71,14 @@ class TestAPI(unittest.TestCase):
         DEFAULT_CALL_ARGS = (DATABASE_DIR, None)
         CALL_ARGS = {"clean": (DATABASE_DIR,)}  # List non-default call args only
         # Test instance methods
-        for api_func_name in ("index", "select", "export", "insert", "clean"):
+        for api_func_name in (
+            "index",
+            "select",
+            "iter_select",
+            "export",
+            "insert",
+            "clean",
+        ):
             with (
                 self.subTest(api_func=api_func_name),
                 mock.patch("betfairdatabase.api.BetfairDatabase") as mock_db_class,
@@ -79,3 +98,29 @@ class TestAPI(unittest.TestCase):
         ):
             api.columns()
             mock_db_class.columns.assert_called_with()
+
+    def test_package_namespace(self):
+        """Public API and submodules are accessible from the package namespace."""
+        for name in betfairdatabase.__all__:
+            with self.subTest(name=name):
+                self.assertIs(getattr(betfairdatabase, name), getattr(api, name))
+        with self.assertRaises(AttributeError):
+            betfairdatabase.does_not_exist
+        self.assertTrue(set(betfairdatabase.__all__) <= set(dir(betfairdatabase)))
+        # Submodules are accessible as attributes, also of a freshly imported package
+        self.assertIs(betfairdatabase.__getattr__("utils"), utils)
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import betfairdatabase as bfdb;"
+                " print(bfdb.utils.ImportPatterns.__name__, bfdb.const.__name__,"
+                " bfdb.api.__name__)",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(
+            proc.stdout.split(),
+            ["ImportPatterns", "betfairdatabase.const", "betfairdatabase.api"],
+        )
@@ -40,7 +40,7 @@ class TestCLI(unittest.TestCase):
 
         First argument (script name) should not be provided inside args.
         """
-        with mock.patch("betfairdatabase.cli.api") as mock_api:
+        with mock.patch("betfairdatabase.api") as mock_api:
             sys.argv = ["bfdb"] + list(args)
             main()
             return mock_api
@@ -185,6 +185,19 @@ class TestCLI(unittest.TestCase):
         proc = subprocess.run(f"{python_exe} -m betfairdatabase --version", shell=True)
         self.assertEqual(proc.returncode, 0)
 
+    def test_lazy_imports(self):
+        """Importing the command line app does not import the database machinery."""
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, betfairdatabase.cli; print('sqlite3' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(proc.stdout.strip(), "False")
+
 
 @mock.patch("builtins.print")
 @mock.patch("builtins.exit")
@@ -1,11 +1,15 @@
+import contextlib
+import os
 import re
 import shutil
+import sqlite3
 import tempfile
 import unittest
-from pathlib import Path
+from pathlib import Path, PurePosixPath, PureWindowsPath
 from unittest.mock import MagicMock, patch
 
 from betfairdatabase import BetfairDatabase
+from betfairdatabase.const import INDEX_FILENAME, SQL_INDEXED_COLUMNS, SQL_TABLE_NAME
 
 
 class TestBetfairDatabase(unittest.TestCase):
@@ -44,3 +48,96 @@ class TestBetfairDatabase(unittest.TestCase):
             for row in all_rows:
                 # Corrupt market did not get imported
                 self.assertNotEqual(row["marketId"], "1.221089567")
+
+    def test_export_to_parquet_without_pyarrow(self):
+        """Exporting to Parquet raises a meaningful error if pyarrow is missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir).resolve()
+            shutil.copytree(
+                self.TEST_DATA_DIR / "datasets/uncompressed", tmpdir, dirs_exist_ok=True
+            )
+            database = BetfairDatabase(tmpdir)
+            database.index()
+            with (
+                patch.dict("sys.modules", {"pyarrow": None, "pyarrow.parquet": None}),
+                self.assertRaisesRegex(ImportError, "requires pyarrow"),
+            ):
+                database.export(tmpdir / "abc.parquet")
+            self.assertFalse((tmpdir / "abc.parquet").exists())
+
+    def test_index_uses_rollback_journal(self):
+        """
+        Index is stored in the default rollback journal mode, and reading
+        from it leaves no journal files behind.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir).resolve()
+            database = BetfairDatabase(tmpdir)
+            database.index()
+            database.select()
+            with contextlib.closing(sqlite3.connect(tmpdir / INDEX_FILENAME)) as conn:
+                journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(journal_mode, "delete")
+            self.assertEqual([p.name for p in tmpdir.iterdir()], [INDEX_FILENAME])
+
+    @unittest.skipIf(
+        os.name != "posix" or os.geteuid() == 0,
+        "Permissions are only enforced for non-root users on POSIX systems.",
+    )
+    def test_select_from_read_only_index(self):
+        """Index can be queried from a directory which the user cannot write to."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            tempfile.TemporaryDirectory() as output_dir,
+        ):
+            tmpdir = Path(tmpdir).resolve()
+            shutil.copytree(
+                self.TEST_DATA_DIR / "datasets/uncompressed", tmpdir, dirs_exist_ok=True
+            )
+            database = BetfairDatabase(tmpdir)
+            row_count = database.index()
+            tmpdir.chmod(0o555)
+            try:
+                self.assertEqual(len(database.select()), row_count)
+                self.assertEqual(len(list(database.iter_select())), row_count)
+                self.assertTrue(database.export(output_dir).exists())
+            finally:
+                tmpdir.chmod(0o755)
+
+    def test_read_only_uri(self):
+        """Read-only URIs are built for POSIX, Windows and UNC paths."""
+        test_cases = [
+            (
+                PurePosixPath("/data/my db/#1?/.betfairdatabaseindex"),
+                "file:///data/my%20db/%231%3F/.betfairdatabaseindex?mode=ro",
+            ),
+            (
+                PureWindowsPath(r"C:\data\.betfairdatabaseindex"),
+                "file:///C:/data/.betfairdatabaseindex?mode=ro",
+            ),
+            (
+                PureWindowsPath(r"\\server\share\data\.betfairdatabaseindex"),
+                "file:////server/share/data/.betfairdatabaseindex?mode=ro",
+            ),
+        ]
+        for index_file, expected_uri in test_cases:
+            with self.subTest(index_file=index_file):
+                uri = BetfairDatabase._build_read_only_uri(index_file)
+                self.assertEqual(uri, expected_uri)
+                # SQLite accepts the URI and only fails to find the file
+                with self.assertRaisesRegex(sqlite3.OperationalError, "unable to open"):
+                    sqlite3.connect(uri, uri=True)
+
+    def test_index_creates_column_indexes(self):
+        """Commonly queried columns are indexed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir).resolve()
+            BetfairDatabase(tmpdir).index()
+            with contextlib.closing(sqlite3.connect(tmpdir / INDEX_FILENAME)) as conn:
+                for column in SQL_INDEXED_COLUMNS:
+                    with self.subTest(column=column):
+                        query_plan = conn.execute(
+                            f"EXPLAIN QUERY PLAN SELECT * FROM {SQL_TABLE_NAME}"
+                            f" WHERE {column} = ''"
+                        ).fetchone()[-1]
+                        self.assertIn(f"USING INDEX {column}Index", query_plan)
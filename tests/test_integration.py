@@ -1,9 +1,11 @@
 import csv
+import importlib.util
 import shutil
 import tempfile
 import unittest
 from collections import Counter
 from pathlib import Path
+from unittest import mock
 
 import betfairdatabase as bfdb
 from betfairdatabase.const import INDEX_FILENAME
@@ -93,6 +95,14 @@ class TestIntegrationPart1(TestIntegrationBase):
         # If it does not throw an error here, it passes
         bfdb.index(self.test_data_dir, force=True)
 
+    def test_index_in_batches(self):
+        """Indexed data is complete when inserted into the index in multiple batches."""
+        bfdb.index(self.test_data_dir)
+        markets = bfdb.select(self.test_data_dir)
+        with mock.patch("betfairdatabase.database.SQL_INSERT_BATCH_SIZE", 2):
+            self.assertEqual(bfdb.index(self.test_data_dir, force=True), len(markets))
+        self.assertEqual(bfdb.select(self.test_data_dir), markets)
+
     def test_index_does_not_exist(self):
         """Trying to fetch data from the database without indexing first."""
         with self.assertRaises(IndexMissingError):
@@ -311,6 +321,23 @@ class TestIntegrationPart1(TestIntegrationBase):
         for market in markets:
             self.assertIsInstance(market, tuple)
 
+    def test_iter_select(self):
+        """Iterating over selected data yields the same results as selecting it."""
+        with self.assertRaises(IndexMissingError):
+            bfdb.iter_select(self.test_data_dir)  # Raised before iterating
+        bfdb.index(self.test_data_dir)
+        for kwargs in (
+            {},
+            {"return_dict": False},
+            {"columns": ["marketId"], "where": "eventTypeId='7'", "limit": 2},
+        ):
+            with self.subTest(**kwargs):
+                markets = bfdb.iter_select(self.test_data_dir, **kwargs)
+                self.assertNotIsInstance(markets, list)
+                self.assertEqual(
+                    list(markets), bfdb.select(self.test_data_dir, **kwargs)
+                )
+
     def test_select_combined_queries(self):
         """Tests the combination of queries for selecting data."""
         bfdb.index(self.test_data_dir)
@@ -373,6 +400,44 @@ class TestIntegrationPart1(TestIntegrationBase):
                     for m1, m2 in zip(reader, markets):
                         self.assertEqual(m1, m2)
 
+    def test_export_to_csv_in_chunks(self):
+        """Exported data is complete when read from the index in multiple chunks."""
+        bfdb.index(self.test_data_dir)
+        output_dir = self.test_data_dir / "output"
+        output_dir.mkdir(exist_ok=True)
+        with mock.patch("betfairdatabase.database.EXPORT_CHUNK_SIZE", 2):
+            csv_file = bfdb.export(self.test_data_dir, output_dir / "chunks.csv")
+        with open(csv_file, "r") as f:
+            reader = csv.DictReader(f)
+            self.assertEqual(reader.fieldnames, bfdb.columns())
+            self.assertEqual(
+                [row["marketId"] for row in reader],
+                [m["marketId"] for m in bfdb.select(self.test_data_dir)],
+            )
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow"), "Parquet export requires pyarrow."
+    )
+    def test_export_to_parquet(self):
+        """Tests exporting the whole database index to a Parquet file."""
+        import pyarrow.parquet as pq
+
+        bfdb.index(self.test_data_dir)
+        output_dir = self.test_data_dir / "output"
+        output_dir.mkdir(exist_ok=True)
+        with mock.patch("betfairdatabase.database.EXPORT_CHUNK_SIZE", 2):
+            parquet_file = bfdb.export(self.test_data_dir, output_dir / "abc.parquet")
+        self.assertEqual(parquet_file, output_dir / "abc.parquet")
+        # Values and their types are preserved
+        self.assertEqual(
+            pq.read_table(parquet_file).to_pylist(), bfdb.select(self.test_data_dir)
+        )
+
+    def test_export_index_missing(self):
+        """Trying to export the database without indexing first."""
+        with self.assertRaises(IndexMissingError):
+            bfdb.export(self.test_data_dir)
+
 
 class TestIntegrationPart2(TestIntegrationBase):
     """
@@ -507,6 +572,37 @@ class TestIntegrationPart2(TestIntegrationBase):
         self.assertNotIn("1.216395251.json", remaining_files)
         self.base_test_db_integrity_after_duplicates_update(old_db_data)  # DB updated
 
+    def test_insert_duplicates_update_quoted_path(self):
+        """Updating rows whose file paths contain a single quote."""
+        self.database_dir = self.database_dir.with_name("test's db")
+        self.database_dir.mkdir()
+        duplicates_dir = self.duplicates_test_setup()
+        old_db_data = bfdb.select(self.database_dir)
+        bfdb.insert(
+            self.database_dir, duplicates_dir, copy=False, on_duplicates="update"
+        )
+        self.base_test_db_integrity_after_duplicates_update(old_db_data)
+
+    def test_insert_from_missing_directory(self):
+        """Inserting from a directory which does not exist inserts nothing."""
+        self.assertEqual(
+            bfdb.insert(self.database_dir, self.test_data_dir / "does_not_exist"), 0
+        )
+        self.assertEqual(bfdb.select(self.database_dir), [])
+
+    def test_insert_duplicates_from_same_source(self):
+        """Duplicates within the same source directory produce one row per market."""
+        shutil.copytree(
+            "./tests/data/duplicates", self.dataset_1 / "duplicates", dirs_exist_ok=True
+        )
+        bfdb.insert(self.database_dir, self.dataset_1, on_duplicates="replace")
+        markets = bfdb.select(self.database_dir)
+        self.assertEqual(len(markets), 6)
+        self.assertEqual(len(set(m["marketId"] for m in markets)), 6)
+        for market in markets:
+            for file_type in ("marketCatalogueFilePath", "marketDataFilePath"):
+                self.assertTrue(Path(market[file_type]).exists())
+
     def test_clean(self):
         """Tests removing rows with missing market data files from the database."""
         database_dir = self.test_data_dir  # Use source data dir as a database
@@ -540,3 +636,19 @@ class TestIntegrationPart2(TestIntegrationBase):
         bfdb.clean(database_dir)
         markets_after = select_market_data_file_paths()
         self.assertEqual(markets_after, markets_before - markets_removed)
+
+    def test_clean_missing_directory(self):
+        """Rows are removed from the database when a whole directory is deleted."""
+        bfdb.index(self.test_data_dir)
+        markets_before = bfdb.select(self.test_data_dir)
+        removed_dir = Path(markets_before[0]["marketDataFilePath"]).parent
+        shutil.rmtree(removed_dir)
+        bfdb.clean(self.test_data_dir)
+        self.assertEqual(
+            bfdb.select(self.test_data_dir),
+            [
+                m
+                for m in markets_before
+                if Path(m["marketDataFilePath"]).parent != removed_dir
+            ],
+        )
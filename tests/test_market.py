@@ -1,7 +1,10 @@
+import tempfile
 import unittest
+from pathlib import Path
 from unittest import mock
 
-from betfairdatabase.market import Market
+from betfairdatabase.exceptions import MarketDataFileError
+from betfairdatabase.market import NO_MARKET_DATA_FILE, Market
 
 MOCK_CTG_FILENAME = "1.22334455.json"
 
@@ -11,17 +14,21 @@ class TestMarket(unittest.TestCase):
     Tests Market class.
     """
 
-    @mock.patch("json.load")  # No need to parse anything
-    @mock.patch("builtins.open")
-    def test_market_catalogues_decoded_as_utf_8(self, mock_open, mock_json_load):
+    def test_market_catalogues_decoded_as_utf_8(self):
         """Market catalogues files are decoded as UTF-8."""
-        market = Market(MOCK_CTG_FILENAME)
-        market.market_catalogue_data  # Trigger parsing
-        mock_open.assert_called_with(mock.ANY, encoding="utf-8")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            market_catalogue_file = Path(tmpdir) / MOCK_CTG_FILENAME
+            market_catalogue_file.write_text(
+                '{"eventName": "Prix de l\'Étoile"}', encoding="utf-8"
+            )
+            self.assertEqual(
+                Market(market_catalogue_file).market_catalogue_data,
+                {"eventName": "Prix de l'Étoile"},
+            )
 
-    @mock.patch("json.load")
+    @mock.patch("betfairdatabase.market.json_loads")
     @mock.patch("builtins.open")
-    def test_racing_property(self, mock_open, mock_json_load):
+    def test_racing_property(self, mock_open, mock_json_loads):
         """Tests the racing property."""
         for event_type_id, is_racing_market in [
             ("7", True),
@@ -29,21 +36,64 @@ class TestMarket(unittest.TestCase):
             ("1", False),
         ]:
             with self.subTest(event_type_id=event_type_id):
-                mock_json_load.return_value = {"eventType": {"id": event_type_id}}
+                mock_json_loads.return_value = {"eventType": {"id": event_type_id}}
                 self.assertEqual(Market(MOCK_CTG_FILENAME).racing, is_racing_market)
 
         # Event type id not provided
-        mock_json_load.return_value = {}
+        mock_json_loads.return_value = {}
         self.assertEqual(Market(MOCK_CTG_FILENAME).racing, False)
 
-    @mock.patch("json.load")
+    @mock.patch("betfairdatabase.market.json_loads")
     @mock.patch("builtins.open")
-    def test_incomplete_market_catalogue(self, mock_open, mock_json_load):
+    def test_incomplete_market_catalogue(self, mock_open, mock_json_loads):
         """Incomplete market catalogue should not throw any errors."""
-        mock_json_load.return_value = {}
+        mock_json_loads.return_value = {}
         market = Market(MOCK_CTG_FILENAME)
         market._market_data_file = (
             "1.22334455"  # Must provide something, else error is thrown
         )
         # Test passes if no exception is raised
         market.create_sql_mapping()
+
+    def test_market_data_file(self):
+        """Market data file is located next to the market catalogue if not provided."""
+        data_dir = Path("./tests/data/datasets/zip-lzma").resolve()
+        market_catalogue_file = data_dir / "1.197931750.json"
+        market_data_file = data_dir / "1.197931750.zip"
+        self.assertEqual(
+            Market(market_catalogue_file).market_data_file, market_data_file
+        )
+        self.assertEqual(
+            Market(market_catalogue_file, market_data_file).market_data_file,
+            market_data_file,
+        )
+
+    def test_market_data_file_missing(self):
+        """
+        Missing market data file raises an error without searching for it if the
+        caller already knows it is missing. Directories are not market data files.
+        """
+        data_dir = Path("./tests/data/datasets/zip-lzma").resolve()
+        market = Market(data_dir / "1.197931750.json", NO_MARKET_DATA_FILE)
+        with (
+            mock.patch.object(Path, "is_file") as mock_is_file,
+            self.assertRaises(MarketDataFileError),
+        ):
+            market.market_data_file
+        mock_is_file.assert_not_called()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            market_catalogue_file = Path(tmpdir) / "1.22334455.json"
+            market_catalogue_file.touch()
+            market_catalogue_file.with_suffix("").mkdir()
+            with self.assertRaises(MarketDataFileError):
+                Market(market_catalogue_file).market_data_file
+
+    def test_move_file_across_file_systems(self):
+        """Files are moved with shutil.move when they cannot be renamed."""
+        with (
+            mock.patch("os.replace", side_effect=OSError) as mock_replace,
+            mock.patch("shutil.move") as mock_move,
+        ):
+            Market._move_file("src", "dst")
+        mock_replace.assert_called_once_with("src", "dst")
+        mock_move.assert_called_once_with("src", "dst")